@@ -275,7 +275,7 @@ class Exchange:
     def _log_exchange_response(self, endpoint, response) -> None:
         """ Log exchange responses """
         if self.log_responses:
-            logger.info(f"API {endpoint}: {response}")
+            logger.info("API %s: %s", endpoint, response)
 
     def ohlcv_candle_limit(self, timeframe: str) -> int:
         """
@@ -935,6 +935,17 @@ class Exchange:
             return self.fetch_stoploss_order(order_id, pair)
         return self.fetch_order(order_id, pair)
 
+    def fetch_stoploss_orders(
+            self, orders: List[Tuple[str, str]]) -> Dict[str, Union[Dict, Exception]]:
+        """
+        Fetch multiple stoploss orders at once.
+        Exchanges which can query stoploss orders concurrently override this.
+        Orders missing from the result must be fetched using fetch_stoploss_order.
+        :param orders: List of (order_id, pair) tuples
+        :return: Dict of {order_id: order}, holding the raised exception if the fetch failed
+        """
+        return {}
+
     def check_order_canceled_empty(self, order: Dict) -> bool:
         """
         Verify if an order has been cancelled without being partially filled
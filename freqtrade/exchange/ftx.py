@@ -1,6 +1,8 @@
 """ FTX exchange subclass """
+import asyncio
 import logging
-from typing import Any, Dict, List, Tuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import ccxt
 
@@ -8,7 +10,7 @@ from freqtrade.enums import Collateral, TradingMode
 from freqtrade.exceptions import (DDosProtection, InsufficientFundsError, InvalidOrderException,
                                   OperationalException, TemporaryError)
 from freqtrade.exchange import Exchange
-from freqtrade.exchange.common import API_FETCH_ORDER_RETRY_COUNT, retrier
+from freqtrade.exchange.common import API_FETCH_ORDER_RETRY_COUNT, retrier, retrier_async
 from freqtrade.misc import safe_value_fallback2
 
 
@@ -41,6 +43,30 @@ class Ftx(Exchange):
             side == "buy" and stop_loss < float(order['price'])
         )
 
+    @contextmanager
+    def _translate_ccxt_errors(self, action: str, invalid_order_msg: str,
+                               insufficient_funds_msg: Optional[str] = None) -> Iterator[None]:
+        """
+        Translate ccxt exceptions raised within the block to freqtrade exceptions.
+        :param action: Failed action, used for temporary errors (e.g. "get order")
+        :param invalid_order_msg: Message used for invalid orders
+        :param insufficient_funds_msg: Message used for insufficient funds.
+            If not set, insufficient funds are treated as temporary error.
+        """
+        try:
+            yield
+        except ccxt.InvalidOrder as e:
+            raise InvalidOrderException(f'{invalid_order_msg}. Message: {e}') from e
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            if insufficient_funds_msg and isinstance(e, ccxt.InsufficientFunds):
+                raise InsufficientFundsError(f'{insufficient_funds_msg}. Message: {e}') from e
+            raise TemporaryError(
+                f'Could not {action} due to {e.__class__.__name__}. Message: {e}') from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
     @retrier(retries=0)
     def stoploss(self, pair: str, amount: float, stop_price: float,
                  order_types: Dict, side: str, leverage: float) -> Dict:
@@ -65,15 +91,18 @@ class Ftx(Exchange):
                 pair, ordertype, side, amount, stop_price, leverage)
             return dry_order
 
-        try:
-            params = self._params.copy()
-            if order_types.get('stoploss', 'market') == 'limit':
-                # set orderPrice to place limit order, otherwise it's a market order
-                params['orderPrice'] = limit_rate
+        params = {**self._params, 'stopPrice': stop_price}
+        if order_types.get('stoploss', 'market') == 'limit':
+            # set orderPrice to place limit order, otherwise it's a market order
+            params['orderPrice'] = limit_rate
 
-            params['stopPrice'] = stop_price
-            amount = self.amount_to_precision(pair, amount)
+        amount = self.amount_to_precision(pair, amount)
 
+        order_desc = (f'{ordertype} {side} order on market {pair}. '
+                      f'Tried to create stoploss with amount {amount} at stoploss {stop_price}')
+        with self._translate_ccxt_errors(f'place {side} order',
+                                         f'Could not create {order_desc}',
+                                         f'Insufficient funds to create {order_desc}'):
             self._lev_prep(pair, leverage)
             order = self._api.create_order(symbol=pair, type=ordertype, side=side,
                                            amount=amount, params=params)
@@ -81,80 +110,113 @@ class Ftx(Exchange):
             logger.info('stoploss order added for %s. '
                         'stop price: %s.', pair, stop_price)
             return order
-        except ccxt.InsufficientFunds as e:
-            raise InsufficientFundsError(
-                f'Insufficient funds to create {ordertype} {side} order on market {pair}. '
-                f'Tried to create stoploss with amount {amount} at stoploss {stop_price}. '
-                f'Message: {e}') from e
-        except ccxt.InvalidOrder as e:
-            raise InvalidOrderException(
-                f'Could not create {ordertype} {side} order on market {pair}. '
-                f'Tried to create stoploss with amount {amount} at stoploss {stop_price}. '
-                f'Message: {e}') from e
-        except ccxt.DDoSProtection as e:
-            raise DDosProtection(e) from e
-        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
-            raise TemporaryError(
-                f'Could not place {side} order due to {e.__class__.__name__}. Message: {e}') from e
-        except ccxt.BaseError as e:
-            raise OperationalException(e) from e
+
+    @staticmethod
+    def _find_stoploss_order(orders: List[Dict], order_id: str) -> Optional[Dict]:
+        """
+        Find the stoploss order with order_id in orders.
+        :return: The order, or None if it's not found exactly once.
+        """
+        order = [order for order in orders if order['id'] == order_id]
+        return order[0] if len(order) == 1 else None
+
+    @staticmethod
+    def _convert_triggered_order(order: Dict, order_id: str) -> Dict:
+        """
+        Convert the order created by a triggered stoploss order to look like the stoploss order.
+        :param order: Order created when the stoploss order was triggered
+        :param order_id: Id of the stoploss order
+        """
+        # Fake type to stop - as this was really a stop order.
+        order['id_stop'] = order['id']
+        order['id'] = order_id
+        order['type'] = 'stop'
+        order['status_stop'] = 'triggered'
+        return order
 
     @retrier(retries=API_FETCH_ORDER_RETRY_COUNT)
     def fetch_stoploss_order(self, order_id: str, pair: str) -> Dict:
         if self._config['dry_run']:
             return self.fetch_dry_run_order(order_id)
 
-        try:
-            orders = self._api.fetch_orders(pair, None, params={'type': 'stop'})
+        with self._translate_ccxt_errors('get order',
+                                         f'Tried to get an invalid order (id: {order_id})'):
+            # FTX has no endpoint to fetch a single conditional order.
+            # Open stop orders are a small list, so look there first and only
+            # fall back to the (potentially long) order history if necessary.
+            orders = self._api.fetch_open_orders(pair, params={'type': 'stop'})
+            order = self._find_stoploss_order(orders, order_id)
+            if not order:
+                orders = self._api.fetch_orders(pair, None, params={'type': 'stop'})
+                order = self._find_stoploss_order(orders, order_id)
+            self._log_exchange_response('fetch_stoploss_order', order)
+            if not order:
+                raise InvalidOrderException(f"Could not get stoploss order for id {order_id}")
+
+            if order.get('status') == 'closed':
+                # Trigger order was triggered ...
+                real_order_id = order.get('info', {}).get('orderId')
+                order1 = self._api.fetch_order(real_order_id, pair)
+                self._log_exchange_response('fetch_stoploss_order1', order1)
+                return self._convert_triggered_order(order1, order_id)
+            return order
 
-            order = [order for order in orders if order['id'] == order_id]
+    @retrier_async(retries=API_FETCH_ORDER_RETRY_COUNT)
+    async def _async_fetch_stoploss_order(self, order_id: str, pair: str) -> Dict:
+        """
+        Asynchronously fetch a stoploss order.
+        Mirrors fetch_stoploss_order, using the async api.
+        """
+        with self._translate_ccxt_errors('get order',
+                                         f'Tried to get an invalid order (id: {order_id})'):
+            orders = await self._api_async.fetch_open_orders(pair, params={'type': 'stop'})
+            order = self._find_stoploss_order(orders, order_id)
+            if not order:
+                orders = await self._api_async.fetch_orders(pair, None, params={'type': 'stop'})
+                order = self._find_stoploss_order(orders, order_id)
             self._log_exchange_response('fetch_stoploss_order', order)
-            if len(order) == 1:
-                if order[0].get('status') == 'closed':
-                    # Trigger order was triggered ...
-                    real_order_id = order[0].get('info', {}).get('orderId')
-
-                    order1 = self._api.fetch_order(real_order_id, pair)
-                    self._log_exchange_response('fetch_stoploss_order1', order1)
-                    # Fake type to stop - as this was really a stop order.
-                    order1['id_stop'] = order1['id']
-                    order1['id'] = order_id
-                    order1['type'] = 'stop'
-                    order1['status_stop'] = 'triggered'
-                    return order1
-                return order[0]
-            else:
+            if not order:
                 raise InvalidOrderException(f"Could not get stoploss order for id {order_id}")
 
-        except ccxt.InvalidOrder as e:
-            raise InvalidOrderException(
-                f'Tried to get an invalid order (id: {order_id}). Message: {e}') from e
-        except ccxt.DDoSProtection as e:
-            raise DDosProtection(e) from e
-        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
-            raise TemporaryError(
-                f'Could not get order due to {e.__class__.__name__}. Message: {e}') from e
-        except ccxt.BaseError as e:
-            raise OperationalException(e) from e
+            if order.get('status') == 'closed':
+                # Trigger order was triggered ...
+                real_order_id = order.get('info', {}).get('orderId')
+                order1 = await self._api_async.fetch_order(real_order_id, pair)
+                self._log_exchange_response('fetch_stoploss_order1', order1)
+                return self._convert_triggered_order(order1, order_id)
+            return order
+
+    def fetch_stoploss_orders(
+            self, orders: List[Tuple[str, str]]) -> Dict[str, Union[Dict, Exception]]:
+        """
+        Fetch multiple stoploss orders concurrently.
+        :param orders: List of (order_id, pair) tuples
+        :return: Dict of {order_id: order}, holding the raised exception if the fetch failed
+        """
+        if self._config['dry_run'] or not orders:
+            return {}
+
+        input_coroutines = [self._async_fetch_stoploss_order(order_id, pair)
+                            for order_id, pair in orders]
+        results = asyncio.get_event_loop().run_until_complete(
+            asyncio.gather(*input_coroutines, return_exceptions=True))
+
+        fetched_orders: Dict[str, Union[Dict, Exception]] = {}
+        for (order_id, _), res in zip(orders, results):
+            if isinstance(res, BaseException) and not isinstance(res, Exception):
+                # Don't swallow cancellation / KeyboardInterrupt
+                raise res
+            fetched_orders[order_id] = res
+        return fetched_orders
 
     @retrier
     def cancel_stoploss_order(self, order_id: str, pair: str) -> Dict:
         if self._config['dry_run']:
             return {}
-        try:
+        with self._translate_ccxt_errors('cancel order', 'Could not cancel order'):
             order = self._api.cancel_order(order_id, pair, params={'type': 'stop'})
             self._log_exchange_response('cancel_stoploss_order', order)
             return order
-        except ccxt.InvalidOrder as e:
-            raise InvalidOrderException(
-                f'Could not cancel order. Message: {e}') from e
-        except ccxt.DDoSProtection as e:
-            raise DDosProtection(e) from e
-        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
-            raise TemporaryError(
-                f'Could not cancel order due to {e.__class__.__name__}. Message: {e}') from e
-        except ccxt.BaseError as e:
-            raise OperationalException(e) from e
 
     def get_order_id_conditional(self, order: Dict[str, Any]) -> str:
         if order['type'] == 'stop':
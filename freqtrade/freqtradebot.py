@@ -7,7 +7,7 @@ import traceback
 from datetime import datetime, time, timezone
 from math import isclose
 from threading import Lock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import arrow
 from schedule import Scheduler
@@ -825,11 +825,18 @@ class FreqtradeBot(LoggingMixin):
         Tries to execute exit orders for open trades (positions)
         """
         trades_closed = 0
+        stoploss_orders: Dict[str, Union[Dict, Exception]] = {}
+        if self.strategy.order_types.get('stoploss_on_exchange'):
+            # Allow exchanges to fetch all stoploss orders at once
+            stoploss_orders = self.exchange.fetch_stoploss_orders(
+                [(trade.stoploss_order_id, trade.pair) for trade in trades
+                 if trade.stoploss_order_id])
         for trade in trades:
             try:
 
                 if (self.strategy.order_types.get('stoploss_on_exchange') and
-                        self.handle_stoploss_on_exchange(trade)):
+                        self.handle_stoploss_on_exchange(
+                            trade, stoploss_orders.get(trade.stoploss_order_id))):
                     trades_closed += 1
                     Trade.commit()
                     continue
@@ -919,12 +926,32 @@ class FreqtradeBot(LoggingMixin):
             logger.exception('Unable to place a stoploss order on exchange.')
         return False
 
-    def handle_stoploss_on_exchange(self, trade: Trade) -> bool:
+    def _fetch_stoploss_order(
+            self, trade: Trade,
+            prefetched_order: Optional[Union[Dict, Exception]] = None) -> Optional[Dict]:
+        """
+        Get the stoploss order of a trade, fetching it from the exchange if it was not prefetched.
+        :param prefetched_order: Result from exchange.fetch_stoploss_orders() for this trade.
+            Exceptions are re-raised, so a failed fetch is not retried again.
+        """
+        if isinstance(prefetched_order, Exception):
+            raise prefetched_order
+        if prefetched_order:
+            return prefetched_order
+        if trade.stoploss_order_id:
+            return self.exchange.fetch_stoploss_order(trade.stoploss_order_id, trade.pair)
+        return None
+
+    def handle_stoploss_on_exchange(
+            self, trade: Trade,
+            prefetched_order: Optional[Union[Dict, Exception]] = None) -> bool:
         """
         Check if trade is fulfilled in which case the stoploss
         on exchange should be added immediately if stoploss on exchange
         is enabled.
         # TODO-lev: liquidation price always on exchange, even without stoploss_on_exchange
+        :param prefetched_order: Result from exchange.fetch_stoploss_orders() for this trade.
+            The stoploss order is fetched from the exchange if None.
         """
 
         logger.debug('Handling stoploss on exchange %s ...', trade)
@@ -933,8 +960,7 @@ class FreqtradeBot(LoggingMixin):
 
         try:
             # First we check if there is already a stoploss on exchange
-            stoploss_order = self.exchange.fetch_stoploss_order(
-                trade.stoploss_order_id, trade.pair) if trade.stoploss_order_id else None
+            stoploss_order = self._fetch_stoploss_order(trade, prefetched_order)
         except InvalidOrderException as exception:
             logger.warning('Unable to fetch stoploss order: %s', exception)
 
@@ -1,12 +1,13 @@
 from random import randint
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import ccxt
 import pytest
 
-from freqtrade.exceptions import DependencyException, InvalidOrderException
+from freqtrade.exceptions import (DDosProtection, DependencyException, InvalidOrderException,
+                                  OperationalException, TemporaryError)
 from freqtrade.exchange.common import API_FETCH_ORDER_RETRY_COUNT
-from tests.conftest import get_patched_exchange
+from tests.conftest import get_mock_coro, get_patched_exchange
 
 from .test_exchange import ccxt_exceptionhandlers
 
@@ -187,10 +188,20 @@ def test_fetch_stoploss_order(default_conf, mocker, limit_sell_order, limit_buy_
 
     default_conf['dry_run'] = False
     api_mock = MagicMock()
+    api_mock.fetch_open_orders = MagicMock(return_value=[{'id': 'X', 'status': 'open'}])
     api_mock.fetch_orders = MagicMock(return_value=[{'id': 'X', 'status': '456'}])
     exchange = get_patched_exchange(mocker, default_conf, api_mock, id='ftx')
+    assert exchange.fetch_stoploss_order('X', 'TKN/BTC')['status'] == 'open'
+    assert api_mock.fetch_open_orders.call_count == 1
+    assert api_mock.fetch_orders.call_count == 0
+
+    api_mock.fetch_open_orders = MagicMock(return_value=[{'id': 'Y', 'status': 'open'}])
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, id='ftx')
     assert exchange.fetch_stoploss_order('X', 'TKN/BTC')['status'] == '456'
+    assert api_mock.fetch_open_orders.call_count == 1
+    assert api_mock.fetch_orders.call_count == 1
 
+    api_mock.fetch_open_orders = MagicMock(return_value=[])
     api_mock.fetch_orders = MagicMock(return_value=[{'id': 'Y', 'status': '456'}])
     exchange = get_patched_exchange(mocker, default_conf, api_mock, id='ftx')
     with pytest.raises(InvalidOrderException, match=r"Could not get stoploss order for id X"):
@@ -227,6 +238,79 @@ def test_fetch_stoploss_order(default_conf, mocker, limit_sell_order, limit_buy_
                            'fetch_stoploss_order', 'fetch_orders',
                            retries=API_FETCH_ORDER_RETRY_COUNT + 1,
                            order_id='_', pair='TKN/BTC')
+    ccxt_exceptionhandlers(mocker, default_conf, api_mock, 'ftx',
+                           'fetch_stoploss_order', 'fetch_open_orders',
+                           retries=API_FETCH_ORDER_RETRY_COUNT + 1,
+                           order_id='_', pair='TKN/BTC')
+
+
+@pytest.mark.asyncio
+async def test__async_fetch_stoploss_order(default_conf, mocker, limit_sell_order):
+    default_conf['dry_run'] = False
+    exchange = get_patched_exchange(mocker, default_conf, id='ftx')
+    exchange._api_async.fetch_open_orders = get_mock_coro([{'id': 'X', 'status': 'open'}])
+    exchange._api_async.fetch_orders = get_mock_coro([{'id': 'Y', 'status': 'closed'}])
+    exchange._api_async.fetch_order = get_mock_coro(limit_sell_order)
+
+    resp = await exchange._async_fetch_stoploss_order('X', 'TKN/BTC')
+    assert resp['status'] == 'open'
+    assert exchange._api_async.fetch_orders.call_count == 0
+
+    resp = await exchange._async_fetch_stoploss_order('Y', 'TKN/BTC')
+    assert exchange._api_async.fetch_orders.call_count == 1
+    assert exchange._api_async.fetch_order.call_count == 1
+    assert resp['id_stop'] == 'mocked_limit_sell'
+    assert resp['id'] == 'Y'
+    assert resp['type'] == 'stop'
+    assert resp['status_stop'] == 'triggered'
+
+    with pytest.raises(InvalidOrderException, match=r"Could not get stoploss order for id Z"):
+        await exchange._async_fetch_stoploss_order('Z', 'TKN/BTC')
+
+    with pytest.raises(InvalidOrderException, match=r"Tried to get an invalid order.*"):
+        exchange._api_async.fetch_open_orders = MagicMock(side_effect=ccxt.InvalidOrder("Nope"))
+        await exchange._async_fetch_stoploss_order('X', 'TKN/BTC')
+
+    with patch('freqtrade.exchange.common.asyncio.sleep', get_mock_coro(None)):
+        with pytest.raises(DDosProtection):
+            exchange._api_async.fetch_open_orders = MagicMock(
+                side_effect=ccxt.DDoSProtection("DDos"))
+            await exchange._async_fetch_stoploss_order('X', 'TKN/BTC')
+        assert exchange._api_async.fetch_open_orders.call_count == API_FETCH_ORDER_RETRY_COUNT + 1
+
+    with pytest.raises(TemporaryError):
+        exchange._api_async.fetch_open_orders = MagicMock(side_effect=ccxt.NetworkError("Dead"))
+        await exchange._async_fetch_stoploss_order('X', 'TKN/BTC')
+    assert exchange._api_async.fetch_open_orders.call_count == API_FETCH_ORDER_RETRY_COUNT + 1
+
+    with pytest.raises(OperationalException):
+        exchange._api_async.fetch_open_orders = MagicMock(side_effect=ccxt.BaseError("Dead"))
+        await exchange._async_fetch_stoploss_order('X', 'TKN/BTC')
+    assert exchange._api_async.fetch_open_orders.call_count == 1
+
+
+def test_fetch_stoploss_orders(default_conf, mocker):
+    default_conf['dry_run'] = True
+    exchange = get_patched_exchange(mocker, default_conf, id='ftx')
+    assert exchange.fetch_stoploss_orders([('X', 'TKN/BTC')]) == {}
+
+    default_conf['dry_run'] = False
+    exchange = get_patched_exchange(mocker, default_conf, id='ftx')
+    assert exchange.fetch_stoploss_orders([]) == {}
+
+    async def mock_fetch(order_id, pair):
+        if order_id == 'Z':
+            raise InvalidOrderException(f"Could not get stoploss order for id {order_id}")
+        return {'id': order_id, 'symbol': pair, 'status': 'open'}
+
+    fetch_mock = mocker.patch('freqtrade.exchange.Ftx._async_fetch_stoploss_order',
+                              side_effect=mock_fetch)
+    res = exchange.fetch_stoploss_orders([('X', 'TKN/BTC'), ('Y', 'ETH/BTC'), ('Z', 'XRP/BTC')])
+    assert fetch_mock.call_count == 3
+    assert len(res) == 3
+    assert res['X'] == {'id': 'X', 'symbol': 'TKN/BTC', 'status': 'open'}
+    assert res['Y'] == {'id': 'Y', 'symbol': 'ETH/BTC', 'status': 'open'}
+    assert isinstance(res['Z'], InvalidOrderException)
 
 
 def test_get_order_id(mocker, default_conf):
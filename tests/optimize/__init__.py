@@ -1,14 +1,16 @@
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, NamedTuple, Optional
 
-import arrow
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, Timestamp, to_timedelta
 
 from freqtrade.enums import SellType
 from freqtrade.exchange import timeframe_to_minutes
 
 
-tests_start_time = arrow.get(2018, 10, 3)
+tests_start_time = datetime(2018, 10, 3, tzinfo=timezone.utc)
 tests_timeframe = '1h'
+_TF_MINUTES = timeframe_to_minutes(tests_timeframe)
 
 
 class BTrade(NamedTuple):
@@ -40,31 +42,33 @@ class BTContainer(NamedTuple):
 
 
 def _get_frame_time_from_offset(offset):
-    minutes = offset * timeframe_to_minutes(tests_timeframe)
-    return tests_start_time.shift(minutes=minutes).datetime
+    return tests_start_time + timedelta(minutes=offset * _TF_MINUTES)
 
 
 def _build_backtest_dataframe(data):
     columns = ['date', 'open', 'high', 'low', 'close', 'volume', 'enter_long', 'exit_long',
                'enter_short', 'exit_short']
-    if len(data[0]) == 8:
+    arr = np.asarray(data, dtype=object)
+    if arr.shape[1] == 8:
         # No short columns
-        data = [d + [0, 0] for d in data]
-    columns = columns + ['enter_tag'] if len(data[0]) == 11 else columns
+        arr = np.hstack([arr, np.zeros((arr.shape[0], 2), dtype=object)])
+    columns = columns + ['enter_tag'] if arr.shape[1] == 11 else columns
 
-    frame = DataFrame.from_records(data, columns=columns)
-    frame['date'] = frame['date'].apply(_get_frame_time_from_offset)
     # Ensure floats are in place
-    for column in ['open', 'high', 'low', 'close', 'volume']:
-        frame[column] = frame[column].astype('float64')
-    if 'enter_tag' not in columns:
-        frame['enter_tag'] = None
+    ohlcv = arr[:, 1:6].astype(np.float64)
+    signals = arr[:, 6:10].astype(np.int64)
+    minutes = arr[:, 0].astype(np.int64) * _TF_MINUTES
+
+    frame = DataFrame({
+        'date': Timestamp(tests_start_time) + to_timedelta(minutes, unit='m'),
+        **{col: ohlcv[:, i] for i, col in enumerate(columns[1:6])},
+        **{col: signals[:, i] for i, col in enumerate(columns[6:10])},
+    })
+    frame['enter_tag'] = arr[:, 10] if 'enter_tag' in columns else None
     if 'exit_tag' not in columns:
         frame['exit_tag'] = None
 
     # Ensure all candles make kindof sense
-    assert all(frame['low'] <= frame['close'])
-    assert all(frame['low'] <= frame['open'])
-    assert all(frame['high'] >= frame['close'])
-    assert all(frame['high'] >= frame['open'])
+    low, high, open_, close = (frame[col].to_numpy() for col in ('low', 'high', 'open', 'close'))
+    assert ((low <= close) & (low <= open_) & (high >= close) & (high >= open_)).all()
     return frame
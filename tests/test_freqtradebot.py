@@ -8,6 +8,7 @@ from math import isclose
 from unittest.mock import ANY, MagicMock, PropertyMock
 
 import arrow
+import ccxt
 import pytest
 
 from freqtrade.constants import CANCEL_REASON, MATH_CLOSE_PREC, UNLIMITED_STAKE_AMOUNT
@@ -15,14 +16,15 @@ from freqtrade.enums import RPCMessageType, RunMode, SellType, SignalDirection,
 from freqtrade.exceptions import (DependencyException, ExchangeError, InsufficientFundsError,
                                   InvalidOrderException, OperationalException, PricingError,
                                   TemporaryError)
+from freqtrade.exchange.common import API_FETCH_ORDER_RETRY_COUNT
 from freqtrade.freqtradebot import FreqtradeBot
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.persistence.models import PairLock
 from freqtrade.strategy.interface import SellCheckTuple
 from freqtrade.worker import Worker
-from tests.conftest import (create_mock_trades, get_patched_freqtradebot, get_patched_worker,
-                            log_has, log_has_re, patch_edge, patch_exchange, patch_get_signal,
-                            patch_wallet, patch_whitelist)
+from tests.conftest import (create_mock_trades, get_patched_exchange, get_patched_freqtradebot,
+                            get_patched_worker, log_has, log_has_re, patch_edge, patch_exchange,
+                            patch_get_signal, patch_wallet, patch_whitelist)
 from tests.conftest_trades import (MOCK_TRADE_COUNT, enter_side, exit_side, mock_order_1,
                                    mock_order_2, mock_order_2_sell, mock_order_3, mock_order_3_sell,
                                    mock_order_4, mock_order_5_stoploss, mock_order_6_sell)
@@ -1725,6 +1727,74 @@ def test_exit_positions(
     assert n == 0
 
 
+def test_exit_positions_stoploss_orders(mocker, default_conf_usdt) -> None:
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    freqtrade.strategy.order_types['stoploss_on_exchange'] = True
+    stoploss_order = {'id': '100', 'status': 'open'}
+    fetch_stoploss_order = mocker.patch('freqtrade.exchange.Exchange.fetch_stoploss_order',
+                                        return_value=stoploss_order)
+
+    trade = MagicMock()
+    trade.pair = 'ETH/USDT'
+    trade.stoploss_order_id = '100'
+    trade.open_order_id = '1234'
+    # Prefetched orders are used as is
+    assert freqtrade.handle_stoploss_on_exchange(trade, stoploss_order) is False
+    assert fetch_stoploss_order.call_count == 0
+    assert freqtrade.handle_stoploss_on_exchange(trade) is False
+    assert fetch_stoploss_order.call_count == 1
+
+    fetch_stoploss_orders = mocker.patch('freqtrade.exchange.Exchange.fetch_stoploss_orders',
+                                         return_value={'100': stoploss_order})
+    handle_sl = mocker.patch('freqtrade.freqtradebot.FreqtradeBot.handle_stoploss_on_exchange',
+                             return_value=False)
+    mocker.patch('freqtrade.freqtradebot.FreqtradeBot.handle_trade', return_value=False)
+    trade2 = MagicMock()
+    trade2.pair = 'XRP/USDT'
+    trade2.stoploss_order_id = None
+
+    assert freqtrade.exit_positions([trade, trade2]) == 0
+    assert fetch_stoploss_orders.call_count == 1
+    assert fetch_stoploss_orders.call_args[0][0] == [('100', 'ETH/USDT')]
+    assert handle_sl.call_count == 2
+    assert handle_sl.call_args_list[0][0] == (trade, stoploss_order)
+    assert handle_sl.call_args_list[1][0] == (trade2, None)
+
+
+def test_exit_positions_stoploss_orders_failed(mocker, default_conf_usdt, caplog) -> None:
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    freqtrade.strategy.order_types['stoploss_on_exchange'] = True
+    fetch_stoploss_order = mocker.patch('freqtrade.exchange.Exchange.fetch_stoploss_order')
+    trade = MagicMock()
+    trade.pair = 'ETH/USDT'
+    trade.stoploss_order_id = '100'
+    trade.open_order_id = '1234'
+
+    # Failed prefetches are not fetched again
+    assert freqtrade.handle_stoploss_on_exchange(
+        trade, InvalidOrderException('Could not get stoploss order for id 100')) is False
+    assert fetch_stoploss_order.call_count == 0
+    assert log_has('Unable to fetch stoploss order: Could not get stoploss order for id 100',
+                   caplog)
+
+    with pytest.raises(TemporaryError, match=r'Dead'):
+        freqtrade.handle_stoploss_on_exchange(trade, TemporaryError('Dead'))
+    assert fetch_stoploss_order.call_count == 0
+
+    # The exchange is only queried for one retry-cycle on temporary errors
+    default_conf_usdt['dry_run'] = False
+    api_mock = MagicMock()
+    api_mock.fetch_open_orders = MagicMock(side_effect=ccxt.NetworkError('DeadBeef'))
+    freqtrade.exchange = get_patched_exchange(mocker, default_conf_usdt, api_mock, id='ftx')
+    mocker.patch('freqtrade.freqtradebot.FreqtradeBot.handle_trade', return_value=False)
+    caplog.clear()
+
+    assert freqtrade.exit_positions([trade]) == 0
+    assert api_mock.fetch_open_orders.call_count == API_FETCH_ORDER_RETRY_COUNT + 1
+    assert log_has_re(r'Unable to exit trade ETH/USDT: Could not get order due to NetworkError.*',
+                      caplog)
+
+
 @pytest.mark.parametrize("is_short", [False, True])
 def test_exit_positions_exception(
     mocker, default_conf_usdt, limit_order, caplog, is_short